@@ -4,23 +4,28 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict
 
 
 def load_jsonl(path: Path) -> list[dict]:
     return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
 
 
+def record_key(record: dict) -> str:
+    # \x1f cannot occur in unit/property text, so the joined string is as
+    # unique as a (unit, property) tuple without allocating one per lookup.
+    return f"{record.get('unit')}\x1f{record.get('property')}"
+
+
 def main() -> None:
     root = Path(__file__).resolve().parents[1]
     base_path = root / "jsonl" / "units_of_measurement.jsonl"
     annotated_path = root / "jsonl" / "units_with_ontologies.jsonl"
 
     annotated_records = load_jsonl(annotated_path)
-    annotations: Dict[Tuple[str, str], dict] = {}
+    annotations: Dict[str, dict] = {}
     for record in annotated_records:
-        key = (record.get("unit"), record.get("property"))
-        annotations[key] = record
+        annotations[record_key(record)] = record
 
     output_lines = []
     changed = 0
@@ -29,8 +34,7 @@ def main() -> None:
             output_lines.append(line)
             continue
         record = json.loads(line)
-        key = (record.get("unit"), record.get("property"))
-        source = annotations.get(key)
+        source = annotations.get(record_key(record))
         if not source:
             output_lines.append(line)
             continue
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import json
 import re
+import sys
 import unicodedata
-from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List
 
 
+_NON_TOKEN_RE = re.compile(r"[^a-z0-9]+")
+
+
 def normalize(text: str | None) -> str | None:
     if not text:
         return None
@@ -20,7 +23,7 @@ def normalize(text: str | None) -> str | None:
 def tokenize(text: str | None) -> set[str]:
     if not text:
         return set()
-    cleaned = re.sub(r"[^a-z0-9]+", " ", text)
+    cleaned = _NON_TOKEN_RE.sub(" ", text)
     return {token for token in cleaned.split() if token}
 
 
@@ -31,12 +34,22 @@ def load_records(path: Path) -> List[Dict[str, Any]]:
             line = line.strip()
             if not line:
                 continue
-            records.append(json.loads(line))
+            record = json.loads(line)
+            # property/system draw from small vocabularies; interning
+            # collapses thousands of duplicate strings to one object per
+            # distinct value, so later hashing compares by pointer.
+            for field in ("property", "system"):
+                value = record.get(field)
+                if isinstance(value, str):
+                    record[field] = sys.intern(value)
+            records.append(record)
     return records
 
 
 def qa(records: List[Dict[str, Any]]) -> None:
-    totals = Counter()
+    # Plain local ints: the coverage tallies have fixed keys, so Counter's
+    # per-increment dict dispatch buys nothing here.
+    total = uo_count = ucum_count = om_count = 0
     uo_mismatch_examples: List[str] = []
     om_missing_ucum: List[str] = []
     ucum_without_om: List[str] = []
@@ -63,10 +76,10 @@ def qa(records: List[Dict[str, Any]]) -> None:
         has_ucum = "ucum" in ids
         has_om = "om" in metadata
 
-        totals["total"] += 1
-        totals["uo" if has_uo else "uo_missing"] += 1
-        totals["ucum" if has_ucum else "ucum_missing"] += 1
-        totals["om" if has_om else "om_missing"] += 1
+        total += 1
+        uo_count += has_uo
+        ucum_count += has_ucum
+        om_count += has_om
 
         if has_ucum and not has_om:
             ucum_without_om.append(record["unit"])
@@ -90,22 +103,27 @@ def qa(records: List[Dict[str, Any]]) -> None:
                 if not matches and len(uo_mismatch_examples) < 10:
                     uo_mismatch_examples.append(f"{record['unit']} -> property '{prop}' not mentioned")
 
-    print("=== Annotation Coverage ===")
-    print(f"Total records: {totals['total']}")
-    print(f"UO matches: {totals['uo']} (missing: {totals['uo_missing']})")
-    print(f"UCUM matches: {totals['ucum']} (missing: {totals['ucum_missing']})")
-    print(f"OM matches: {totals['om']} (missing: {totals['om_missing']})")
-
-    print("\n=== Potential Issues ===")
-    print(f"UCUM present but missing OM metadata: {len(ucum_without_om)}")
+    # The fixed-shape head of the report interpolates in one block; only the
+    # data-dependent sample lines are appended piecemeal. One buffered write
+    # instead of a print() per line.
+    lines = [
+        f"""=== Annotation Coverage ===
+Total records: {total}
+UO matches: {uo_count} (missing: {total - uo_count})
+UCUM matches: {ucum_count} (missing: {total - ucum_count})
+OM matches: {om_count} (missing: {total - om_count})
+
+=== Potential Issues ===
+UCUM present but missing OM metadata: {len(ucum_without_om)}"""
+    ]
     if ucum_without_om:
-        print("  e.g. ", ", ".join(ucum_without_om[:5]))
-    print(f"OM metadata UCUM mismatch: {len(om_missing_ucum)}")
+        lines.append("  e.g.  " + ", ".join(ucum_without_om[:5]))
+    lines.append(f"OM metadata UCUM mismatch: {len(om_missing_ucum)}")
     if om_missing_ucum:
-        print("  e.g. ", "; ".join(om_missing_ucum[:5]))
-    print(f"UO property mismatch samples ({len(uo_mismatch_examples)} shown):")
-    for sample in uo_mismatch_examples:
-        print("  -", sample)
+        lines.append("  e.g.  " + "; ".join(om_missing_ucum[:5]))
+    lines.append(f"UO property mismatch samples ({len(uo_mismatch_examples)} shown):")
+    lines.extend(f"  - {sample}" for sample in uo_mismatch_examples)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> None: